@@ -13,12 +13,19 @@ Requirements:
     - Python 3.7+
     - selenium - handle dynamic pages
     - beautifulsoup4 - to parse HTML content easily
-    
+    - requests + selectolax (optional) - fast HTTP path for static pages
+
 Installation:
     pip install selenium beautifulsoup4
+    pip install requests selectolax  # optional, enables the fast path
 
 Usage:
     python scrape_job.py
+
+Performance:
+    The script also runs unmodified under PyPy, and the hot extraction
+    helpers can optionally be compiled with Cython in pure-Python mode
+    (see setup.py) for batch scrapes of thousands of pages.
 """
 
 from selenium import webdriver
@@ -28,9 +35,34 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 import json
-import time
+import os
+import queue
+import re
+
+# Optional C-implemented JSON (3-10x faster than stdlib for the JSON-LD
+# blocks and output serialization). stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
+# Optional fast path: plain HTTP + C-backed HTML parser.
+# Most iCIMS iframe pages serve the job content (including JSON-LD) as
+# static HTML, so a single GET + in-process parse replaces the whole
+# Chrome startup/load cycle. Selenium remains the fallback.
+try:
+    import requests
+    from selectolax.lexbor import LexborHTMLParser
+    FAST_PATH_AVAILABLE = True
+except ImportError:
+    requests = None
+    LexborHTMLParser = None
+    FAST_PATH_AVAILABLE = False
+
 
 def setup_chrome_driver():
     """
@@ -45,13 +77,30 @@ def setup_chrome_driver():
         - Disabled automation flags for stealth
     """
     chrome_options = Options()
-    
-    # Run Chrome in headless mode (no GUI)
-    chrome_options.add_argument('--headless')
-    
+
+    # Return from driver.get at DOMContentLoaded instead of waiting for
+    # every subresource - we wait explicitly for the job content anyway
+    chrome_options.page_load_strategy = 'eager'
+
+    # Run Chrome in headless mode (no GUI) - the 'new' implementation
+    # is faster than legacy headless on recent Chrome
+    chrome_options.add_argument('--headless=new')
+
     # Security and compatibility settings
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
+
+    # Trim per-session resource usage: no GPU, extensions, background
+    # networking/timers, translate popups, audio, or image rendering.
+    # Less work per page means faster loads, lower RAM, and more
+    # headroom for parallel sessions
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-background-timer-throttling')
+    chrome_options.add_argument('--disable-features=TranslateUI,BlinkGenPropertyTrees')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--mute-audio')
     
     # Anti-bot detection measures
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
@@ -66,12 +115,491 @@ def setup_chrome_driver():
         'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
         'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     )
-    
+
+    # Don't render images at all - the scraper only reads text
+    chrome_options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+
     # Initialize and return driver
     driver = webdriver.Chrome(options=chrome_options)
+    block_heavy_resources(driver)
     return driver
 
 
+# URL patterns the scraper never needs: images, webfonts, stylesheets,
+# and third-party analytics. Blocking them at the network layer cuts
+# page-load bandwidth roughly in half. JavaScript stays enabled because
+# iCIMS needs it to render the job content.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.css",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*"
+]
+
+
+def block_heavy_resources(driver):
+    """
+    Block images/CSS/fonts/analytics via Chrome DevTools Protocol.
+
+    Args:
+        driver: Selenium WebDriver instance (Chrome)
+
+    Note:
+        Silently does nothing if CDP is unavailable (e.g. a non-Chrome
+        driver) - blocking is an optimization, not a requirement.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS}
+        )
+    except Exception:
+        pass
+
+
+# Selector lists, most specific to most general, built once at import.
+# The Selenium title list keeps its (By, selector) pairs; the fast-path
+# list is pure CSS. Description selectors are the same strings on both
+# paths.
+TITLE_SELECTORS = (
+    (By.CSS_SELECTOR, "h1.iCIMS_JobsTable h2"),
+    (By.CSS_SELECTOR, ".iCIMS_Header"),
+    (By.CSS_SELECTOR, "h1"),
+    (By.CSS_SELECTOR, "h2.iCIMS_InfoMsg_Job"),
+    (By.XPATH, "//div[@class='iCIMS_JobsTable']//h2")
+)
+
+FAST_TITLE_SELECTORS = (
+    "h1.iCIMS_JobsTable h2",
+    ".iCIMS_Header",
+    "h1",
+    "h2.iCIMS_InfoMsg_Job",
+    "div.iCIMS_JobsTable h2"
+)
+
+DESC_SELECTORS = (
+    ".iCIMS_InfoMsg.iCIMS_InfoField_Job",
+    ".iCIMS_JobContent",
+    "div[class*='JobDescription']",
+    "div.iCIMS_Expandable_Container"
+)
+
+# Which selector matched last, per field. iCIMS portals on one domain
+# use the same template, so in a batch scrape trying last time's winner
+# first usually hits on the first attempt.
+_LAST_WINNING_SELECTOR = {"title": None, "title_fast": None, "desc": None}
+
+
+def _selector_order(cache_key, selectors):
+    """
+    Yield selectors with the last winning one (if any) tried first.
+
+    Args:
+        cache_key (str): Key into _LAST_WINNING_SELECTOR
+        selectors (tuple): The full selector list for this field
+    """
+    winner = _LAST_WINNING_SELECTOR.get(cache_key)
+    if winner is not None and winner in selectors:
+        yield winner
+    for selector in selectors:
+        if selector != winner:
+            yield selector
+
+
+def fetch_iframe_html(url, session, debug=True):
+    """
+    Fetch the job content HTML over plain HTTP (no browser).
+
+    Args:
+        url (str): Full URL of the job posting
+        session: requests.Session for connection reuse
+        debug (bool): Enable debug output
+
+    Returns:
+        str: HTML of the iframe document, or None if it could not be found
+
+    Logic:
+        The outer iCIMS page embeds the actual job content in an iframe.
+        We fetch the outer page, pull the iframe src out of the markup,
+        then fetch that URL directly - two GETs instead of a full
+        Chrome session.
+    """
+    response = session.get(url, timeout=15)
+    response.raise_for_status()
+
+    # Locate the content iframe src in the outer page markup
+    match = re.search(
+        r'<iframe[^>]+id=["\']icims_content_iframe["\'][^>]+src=["\']([^"\']+)["\']',
+        response.text
+    )
+    if not match:
+        # src sometimes precedes the id attribute
+        match = re.search(
+            r'<iframe[^>]+src=["\']([^"\']+)["\'][^>]+id=["\']icims_content_iframe["\']',
+            response.text
+        )
+    if not match:
+        if debug:
+            print("✗ Content iframe not found in static HTML")
+        return None
+
+    iframe_url = match.group(1).replace('&amp;', '&')
+    if debug:
+        print(f"✓ Content iframe src: {iframe_url[:80]}...")
+
+    iframe_response = session.get(iframe_url, timeout=15)
+    iframe_response.raise_for_status()
+    return iframe_response.text
+
+
+def extract_job_title_fast(tree, debug=True):
+    """
+    Extract job title from a parsed selectolax tree.
+
+    Args:
+        tree: selectolax LexborHTMLParser tree
+        debug (bool): Enable debug output
+
+    Returns:
+        str: Job title or None if not found
+    """
+    for selector in _selector_order("title_fast", FAST_TITLE_SELECTORS):
+        element = tree.css_first(selector)
+        if element:
+            title = element.text(strip=True)
+            if title:
+                _LAST_WINNING_SELECTOR["title_fast"] = selector
+                if debug:
+                    print(f"✓ Job Title found: {title}")
+                return title
+
+    if debug:
+        print("✗ Job title not found")
+    return None
+
+
+def extract_location_fast(tree, debug=True):
+    """
+    Extract job location from definition list elements in a parsed tree.
+
+    Args:
+        tree: selectolax LexborHTMLParser tree
+        debug (bool): Enable debug output
+
+    Returns:
+        str: Location or None if not found
+    """
+    for elem in tree.css("dd"):
+        text = elem.text(strip=True)
+        # Location typically contains comma or 'Remote'
+        if ',' in text or 'remote' in text.lower():
+            if debug:
+                print(f"✓ Location found: {text}")
+            return text
+
+    return None
+
+
+def extract_definition_lists_fast(tree, debug=True):
+    """
+    Extract key-value pairs from definition lists in a parsed tree.
+
+    Args:
+        tree: selectolax LexborHTMLParser tree
+        debug (bool): Enable debug output
+
+    Returns:
+        dict: Dictionary of extracted fields
+    """
+    additional_info = {}
+
+    for dl in tree.css("dl"):
+        dts = dl.css("dt")
+        dds = dl.css("dd")
+
+        for dt, dd in zip(dts, dds):
+            key = dt.text(strip=True)
+            value = dd.text(strip=True)
+
+            if key and value:
+                additional_info[key] = value
+                if debug:
+                    print(f"✓ Field extracted: {key} = {value}")
+
+    return additional_info
+
+
+def extract_description_fast(tree, debug=True):
+    """
+    Extract full job description text from a parsed tree.
+
+    Args:
+        tree: selectolax LexborHTMLParser tree
+        debug (bool): Enable debug output
+
+    Returns:
+        str: Job description or None if not found
+    """
+    for selector in _selector_order("desc", DESC_SELECTORS):
+        for elem in tree.css(selector):
+            text = elem.text(strip=True)
+            # Description should be substantial
+            if len(text) > 100:
+                _LAST_WINNING_SELECTOR["desc"] = selector
+                if debug:
+                    print(f"✓ Description found ({len(text)} characters)")
+                return text
+
+    if debug:
+        print("✗ Description not found")
+    return None
+
+
+# One keep-alive HTTP session per thread, so batch scrapes reuse the
+# TCP/TLS connection to the portal across URLs instead of paying a new
+# handshake each time. Per-thread keeps it safe for scrape_many_parallel.
+_http_local = threading.local()
+
+
+def _get_http_session():
+    """
+    Return this thread's persistent requests.Session, creating it on
+    first use.
+    """
+    session = getattr(_http_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers['User-Agent'] = (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+            'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        )
+        _http_local.session = session
+    return session
+
+
+def scrape_icims_job_fast(url, debug=True, collect_full_text=False):
+    """
+    Scrape a job posting over plain HTTP, without launching Chrome.
+
+    Args:
+        url (str): Full URL of the job posting
+        debug (bool): Enable detailed logging
+        collect_full_text (bool): Also store the page's full text as
+            'full_page_text'
+
+    Returns:
+        dict: Complete job data, or None if the static HTML was unusable
+        (caller should fall back to the Selenium path)
+
+    Why:
+        Chrome startup + page load dominates scrape time (seconds). When
+        the iframe URL serves static HTML with the JSON-LD already in it,
+        two HTTP requests and an in-process parse get the same data in
+        ~100ms.
+    """
+    if not FAST_PATH_AVAILABLE:
+        return None
+
+    try:
+        if debug:
+            print("\n" + "="*70)
+            print("FAST PATH: Fetching Job Content over HTTP")
+            print("="*70)
+            print(f"URL: {url}")
+
+        session = _get_http_session()
+
+        html = fetch_iframe_html(url, session, debug)
+        if not html:
+            return None
+
+        tree = LexborHTMLParser(html)
+
+        # Initialize data structure
+        job_data = {
+            'url': url,
+            'scrape_timestamp': datetime.now().isoformat(),
+            'job_id': None,
+            'job_title': None,
+            'company': None,
+            'location': None,
+            'description': None,
+            'posted_date': None,
+            'employment_type': None,
+            'additional_info': {},
+            'salary': None
+        }
+
+        # Extract job ID from URL
+        if '/jobs/' in url:
+            job_data['job_id'] = url.split('/jobs/')[1].split('/')[0]
+            if debug:
+                print(f"✓ Job ID: {job_data['job_id']}")
+
+        # JSON-LD first - it is usually present in the static HTML and
+        # already complete, letting us skip the DOM extractors below
+        json_ld_data = extract_json_ld(tree, debug)
+        merge_json_ld(job_data, json_ld_data)
+
+        if not job_data['job_title']:
+            job_data['job_title'] = extract_job_title_fast(tree, debug)
+        if not job_data['location']:
+            job_data['location'] = extract_location_fast(tree, debug)
+        if not job_data['description']:
+            job_data['description'] = extract_description_fast(tree, debug)
+        job_data['additional_info'] = extract_definition_lists_fast(tree, debug)
+
+        # If the static HTML held neither a title nor a description, the
+        # page likely needs JavaScript - let the Selenium path handle it
+        if not job_data['job_title'] and not job_data['description']:
+            if debug:
+                print("✗ Static HTML missing job content - falling back to Selenium")
+            return None
+
+        if collect_full_text and tree.body is not None:
+            job_data['full_page_text'] = tree.body.text()
+
+        if debug:
+            print("\n" + "="*70)
+            print("✓ FAST PATH EXTRACTION COMPLETE")
+            print("="*70)
+
+        return job_data
+
+    except Exception as e:
+        if debug:
+            print(f"✗ Fast path failed ({str(e)[:80]}) - falling back to Selenium")
+        return None
+
+
+# Single JS payload that gathers every field in one WebDriver round trip.
+# Each find_element/find_elements call costs a full HTTP exchange with
+# chromedriver (~14ms each); running the selectors inside the page and
+# returning one dict collapses 10+ round trips into 1.
+EXTRACT_ALL_JS = """
+return (function() {
+    var titleSelectors = [
+        'h1.iCIMS_JobsTable h2',
+        '.iCIMS_Header',
+        'h1',
+        'h2.iCIMS_InfoMsg_Job',
+        'div.iCIMS_JobsTable h2'
+    ];
+    var descSelectors = [
+        '.iCIMS_InfoMsg.iCIMS_InfoField_Job',
+        '.iCIMS_JobContent',
+        "div[class*='JobDescription']",
+        'div.iCIMS_Expandable_Container'
+    ];
+
+    var title = null;
+    for (var i = 0; i < titleSelectors.length; i++) {
+        var el = document.querySelector(titleSelectors[i]);
+        if (el && el.innerText.trim()) {
+            title = el.innerText.trim();
+            break;
+        }
+    }
+
+    var location = null;
+    var dds = document.querySelectorAll('dd');
+    for (var i = 0; i < dds.length; i++) {
+        var text = dds[i].innerText.trim();
+        if (text.indexOf(',') !== -1 || text.toLowerCase().indexOf('remote') !== -1) {
+            location = text;
+            break;
+        }
+    }
+
+    var dlPairs = [];
+    var dls = document.querySelectorAll('dl');
+    for (var i = 0; i < dls.length; i++) {
+        var dts = dls[i].querySelectorAll('dt');
+        var vals = dls[i].querySelectorAll('dd');
+        for (var j = 0; j < dts.length && j < vals.length; j++) {
+            dlPairs.push([dts[j].innerText.trim(), vals[j].innerText.trim()]);
+        }
+    }
+
+    var description = null;
+    for (var i = 0; i < descSelectors.length; i++) {
+        var els = document.querySelectorAll(descSelectors[i]);
+        for (var j = 0; j < els.length; j++) {
+            var text = els[j].innerText.trim();
+            if (text.length > 100) {
+                description = text;
+                break;
+            }
+        }
+        if (description) break;
+    }
+
+    return {
+        title: title,
+        location: location,
+        dl_pairs: dlPairs,
+        description: description
+    };
+})();
+"""
+
+
+def extract_all_via_js(driver, debug=True):
+    """
+    Extract title, location, definition lists, and description in a
+    single JavaScript round trip.
+
+    Args:
+        driver: Selenium WebDriver instance
+        debug (bool): Enable debug output
+
+    Returns:
+        dict: {'title', 'location', 'additional_info', 'description'}
+        or None if the script failed (caller should fall back to the
+        per-selector extractors)
+
+    Why:
+        Every find_element call is a separate HTTP request to
+        chromedriver. The per-selector extractors issue 10+ of them per
+        page; one execute_script does the same DOM work in-page and
+        returns everything at once.
+    """
+    try:
+        data = driver.execute_script(EXTRACT_ALL_JS)
+        if not isinstance(data, dict):
+            return None
+
+        additional_info = {}
+        for key, value in data.get('dl_pairs') or []:
+            if key and value:
+                additional_info[key] = value
+                if debug:
+                    print(f"✓ Field extracted: {key} = {value}")
+
+        result = {
+            'title': data.get('title'),
+            'location': data.get('location'),
+            'additional_info': additional_info,
+            'description': data.get('description')
+        }
+
+        if debug:
+            if result['title']:
+                print(f"✓ Job Title found: {result['title']}")
+            if result['location']:
+                print(f"✓ Location found: {result['location']}")
+            if result['description']:
+                print(f"✓ Description found ({len(result['description'])} characters)")
+
+        return result
+
+    except Exception as e:
+        if debug:
+            print(f"✗ Batched JS extraction failed: {str(e)[:80]}")
+        return None
+
+
 def extract_job_title(driver, debug=True):
     """
     Extract job title from the page using multiple selector strategies.
@@ -86,28 +614,24 @@ def extract_job_title(driver, debug=True):
     Strategy:
         Tries multiple CSS selectors in order of reliability
     """
-    # List of selectors to try (most specific to most general)
-    title_selectors = [
-        (By.CSS_SELECTOR, "h1.iCIMS_JobsTable h2"),
-        (By.CSS_SELECTOR, ".iCIMS_Header"),
-        (By.CSS_SELECTOR, "h1"),
-        (By.CSS_SELECTOR, "h2.iCIMS_InfoMsg_Job"),
-        (By.XPATH, "//div[@class='iCIMS_JobsTable']//h2")
-    ]
-    
-    for by, selector in title_selectors:
-        try:
-            element = driver.find_element(by, selector)
-            if element and element.text.strip():
-                title = element.text.strip()
+    try:
+        # find_elements (plural) returns [] on a miss instead of
+        # raising - most selectors miss, and creating/formatting an
+        # exception per miss is pure overhead in this loop
+        for by, selector in _selector_order("title", TITLE_SELECTORS):
+            elements = driver.find_elements(by, selector)
+            if not elements:
+                continue
+            title = elements[0].text.strip()
+            if title:
+                _LAST_WINNING_SELECTOR["title"] = (by, selector)
                 if debug:
                     print(f"✓ Job Title found: {title}")
                 return title
-        except Exception as e:
-            if debug:
-                print(f"  Selector '{selector}' failed: {str(e)[:50]}")
-            continue
-    
+    except Exception as e:
+        if debug:
+            print(f"✗ Title extraction failed: {str(e)[:50]}")
+
     if debug:
         print("✗ Job title not found")
     return None
@@ -126,20 +650,27 @@ def extract_location(driver, debug=True):
         
     Logic:
         Looks for <dd> elements containing comma or 'Remote'
+
+    Performance:
+        All <dd> texts come back in one execute_script call; reading
+        elem.text per element costs a WebDriver round trip each, while
+        the string filtering here is microseconds in Python.
     """
     try:
-        location_elements = driver.find_elements(By.CSS_SELECTOR, "dd")
-        for elem in location_elements:
-            text = elem.text.strip()
+        texts = driver.execute_script(
+            "return [...document.querySelectorAll('dd')]"
+            ".map(e => e.textContent.trim());"
+        )
+        for text in texts or []:
             # Location typically contains comma or 'Remote'
-            if ',' in text or 'Remote' in text.lower():
+            if ',' in text or 'remote' in text.lower():
                 if debug:
                     print(f"✓ Location found: {text}")
                 return text
     except Exception as e:
         if debug:
             print(f"✗ Location extraction failed: {str(e)}")
-    
+
     return None
 
 
@@ -159,32 +690,60 @@ def extract_definition_lists(driver, debug=True):
             <dt>Field Name:</dt>
             <dd>Field Value</dd>
         </dl>
+
+    Performance:
+        All dt/dd pairs are gathered with one execute_script call - the
+        old per-element loop cost 1 + 2 round trips per <dl> to
+        chromedriver. The element loop remains as a fallback.
     """
     additional_info = {}
-    
+
+    try:
+        # One round trip: collect every [dt, dd] text pair in-page
+        pairs = driver.execute_script(
+            "return Array.from(document.querySelectorAll('dl')).flatMap(dl => {"
+            " const ts = [...dl.querySelectorAll('dt')],"
+            "       ds = [...dl.querySelectorAll('dd')];"
+            " return ts.map((t, i) => [t.innerText.trim(),"
+            "                          ds[i] ? ds[i].innerText.trim() : '']);"
+            "});"
+        )
+
+        for key, value in pairs or []:
+            if key and value:
+                additional_info[key] = value
+                if debug:
+                    print(f"✓ Field extracted: {key} = {value}")
+
+        return additional_info
+
+    except Exception as e:
+        if debug:
+            print(f"  Batched dl extraction failed: {str(e)[:50]}")
+
+    # Fallback: walk the definition lists element by element
     try:
-        # Find all definition lists on the page
         dls = driver.find_elements(By.TAG_NAME, "dl")
-        
+
         for dl in dls:
             # Get all terms (labels) and descriptions (values)
             dts = dl.find_elements(By.TAG_NAME, "dt")
             dds = dl.find_elements(By.TAG_NAME, "dd")
-            
+
             # Pair them together
             for dt, dd in zip(dts, dds):
                 key = dt.text.strip()
                 value = dd.text.strip()
-                
+
                 if key and value:
                     additional_info[key] = value
                     if debug:
                         print(f"✓ Field extracted: {key} = {value}")
-        
+
     except Exception as e:
         if debug:
             print(f"✗ Definition list extraction failed: {str(e)}")
-    
+
     return additional_info
 
 
@@ -202,57 +761,72 @@ def extract_description(driver, debug=True):
     Strategy:
         Tries multiple selectors for description containers
     """
-    desc_selectors = [
-        ".iCIMS_InfoMsg.iCIMS_InfoField_Job",
-        ".iCIMS_JobContent",
-        "div[class*='JobDescription']",
-        "div.iCIMS_Expandable_Container"
-    ]
-    
-    for selector in desc_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            for elem in elements:
+    try:
+        for selector in _selector_order("desc", DESC_SELECTORS):
+            for elem in driver.find_elements(By.CSS_SELECTOR, selector):
                 text = elem.text.strip()
                 # Description should be substantial
                 if len(text) > 100:
+                    _LAST_WINNING_SELECTOR["desc"] = selector
                     if debug:
                         print(f"✓ Description found ({len(text)} characters)")
                     return text
-        except Exception as e:
-            if debug:
-                print(f"  Selector '{selector}' failed: {str(e)[:50]}")
-            continue
-    
+    except Exception as e:
+        if debug:
+            print(f"✗ Description extraction failed: {str(e)[:50]}")
+
     if debug:
         print("✗ Description not found")
     return None
 
 
-def extract_json_ld(soup, debug=True):
+def extract_json_ld(doc, debug=True):
     """
     Extract structured data from JSON-LD schema markup.
-    
+
     Args:
-        soup: BeautifulSoup object of the page
+        doc: Parsed page - a selectolax LexborHTMLParser tree or a
+            BeautifulSoup object
         debug (bool): Enable debug output
-        
+
     Returns:
         dict: Structured job data or empty dict
-        
+
     About JSON-LD:
         JSON-LD is a structured data format used by search engines.
         It contains standardized job posting information.
     """
     structured_data = {}
-    
+
     try:
-        # Find all JSON-LD script tags
-        scripts = soup.find_all('script', type='application/ld+json')
-        
+        # Find all JSON-LD script tags (selectolax tree or bs4 soup)
+        if LexborHTMLParser is not None and isinstance(doc, LexborHTMLParser):
+            scripts = [
+                node.text() for node in
+                doc.css('script[type="application/ld+json"]')
+            ]
+        else:
+            # str() matters: bs4 yields a NavigableString subclass,
+            # which orjson.loads rejects (it only takes exact str/bytes)
+            scripts = [
+                str(script.string or '') for script in
+                doc.find_all('script', type='application/ld+json')
+            ]
+
         for script in scripts:
+            raw = script or ""
+
+            # Cheap substring check before the JSON parse - iCIMS pages
+            # carry several ld+json blocks (BreadcrumbList, Organization)
+            # and only the JobPosting one is worth decoding
+            if '"JobPosting"' not in raw:
+                continue
+
             try:
-                data = json.loads(script.string)
+                if orjson is not None:
+                    data = orjson.loads(raw)
+                else:
+                    data = json.loads(raw)
                 
                 # Check if this is a JobPosting schema
                 if isinstance(data, dict) and data.get('@type') == 'JobPosting':
@@ -291,35 +865,206 @@ def extract_json_ld(soup, debug=True):
     return structured_data
 
 
-def scrape_icims_job(url, debug=True):
+# Persistent index of already-scraped postings, keyed by job_id. On
+# incremental runs a cache hit skips the browser, the iframe wait, and
+# every extractor - the page isn't touched at all.
+SEEN_CACHE_FILE = 'scraped_jobs_index.ndjson'
+_seen_cache = None
+_seen_cache_lock = threading.Lock()
+
+
+def _job_id_from_url(url):
+    """
+    Pull the numeric job id out of an iCIMS posting URL, or None.
+    """
+    if '/jobs/' in url:
+        return url.split('/jobs/')[1].split('/')[0]
+    return None
+
+
+def _load_seen_cache():
+    """
+    Load (once) and return the job_id -> job_data index from disk.
+    """
+    global _seen_cache
+    with _seen_cache_lock:
+        if _seen_cache is None:
+            cache = {}
+            if os.path.exists(SEEN_CACHE_FILE):
+                # skip_invalid: a crash mid-append can leave a truncated
+                # last line, and one bad line must not poison every
+                # future run - that crash-safety is the point of NDJSON
+                for record in ndjson_to_json_array(SEEN_CACHE_FILE,
+                                                   skip_invalid=True):
+                    job_id = record.get('job_id')
+                    if job_id:
+                        cache[job_id] = record
+            _seen_cache = cache
+        return _seen_cache
+
+
+def _remember_job(job_data):
+    """
+    Record a freshly scraped job in the in-memory and on-disk index.
+
+    Note:
+        Always appends, even for a job_id already in the index - that
+        only happens on a force=True re-scrape, and the refreshed
+        record must land on disk too. _load_seen_cache is
+        last-write-wins per job_id, so the newest line prevails.
+    """
+    job_id = job_data.get('job_id')
+    if not job_id:
+        return
+    cache = _load_seen_cache()
+    with _seen_cache_lock:
+        cache[job_id] = job_data
+    append_ndjson(job_data, SEEN_CACHE_FILE)
+
+
+def merge_json_ld(job_data, json_ld_data):
+    """
+    Fill empty job_data fields from JSON-LD structured data.
+
+    Args:
+        job_data (dict): The result dict being assembled
+        json_ld_data (dict): Output of extract_json_ld
+
+    Note:
+        JSON-LD's 'title' maps to our 'job_title'; other keys match
+        job_data directly. Existing values are never overwritten.
+    """
+    if not json_ld_data:
+        return
+
+    if json_ld_data.get('title') and not job_data.get('job_title'):
+        job_data['job_title'] = json_ld_data['title']
+
+    for key in ('company', 'location', 'description',
+                'posted_date', 'employment_type', 'salary'):
+        if json_ld_data.get(key) and not job_data.get(key):
+            job_data[key] = json_ld_data[key]
+
+
+def scrape_icims_job(url, debug=True, driver=None, pool=None,
+                     collect_full_text=False, force=False,
+                     driver_factory=None):
     """
     Main function to scrape job posting from iCIMS career portal.
-    
+
     Args:
         url (str): Full URL of the job posting
         debug (bool): Enable detailed logging
-        
+        collect_full_text (bool): Also store the page's full rendered
+            text as 'full_page_text'. Off by default - it often adds
+            hundreds of KB per job that downstream consumers never read
+        force (bool): Re-scrape even if this job_id is already in the
+            persistent index. By default, previously scraped postings
+            are returned from cache without touching the page
+        driver: Optional existing WebDriver to reuse. When provided, the
+            browser is NOT closed afterwards - Chrome startup dominates
+            scrape time, so batch callers should create one driver and
+            pass it for every URL (see scrape_many)
+        pool: Optional BrowserPool; a warm driver is checked out for
+            this scrape and released back afterwards. Ignored when
+            `driver` is given
+        driver_factory: Optional zero-argument callable returning a
+            reusable WebDriver. Unlike `driver`, it is only invoked if
+            the cache and the HTTP fast path both miss, so URLs they
+            satisfy never pay for a browser (see scrape_many_parallel).
+            The returned driver is caller-managed and not quit here
+
     Returns:
         dict: Complete job data or None if failed
-        
+
     Process:
-        1. Initialize Chrome driver
-        2. Load the page
-        3. Switch to iframe (iCIMS content is in iframe)
-        4. Extract all job details
-        5. Return structured data
+        1. Try the HTTP fast path (no browser) if available
+        2. Initialize Chrome driver (or reuse the one passed in)
+        3. Load the page
+        4. Switch to iframe (iCIMS content is in iframe)
+        5. Extract all job details
+        6. Return structured data
     """
-    driver = None
-    
+    # The cheapest scrape is none at all: if this job_id is already in
+    # the persistent index, return the stored record
+    job_id = _job_id_from_url(url)
+    if not force and job_id:
+        cached = _load_seen_cache().get(job_id)
+        # A cached record without full text can't satisfy a caller who
+        # asked for it - treat that as a miss and re-scrape
+        if cached and not (collect_full_text and 'full_page_text' not in cached):
+            if debug:
+                print(f"✓ Job {job_id} already scraped - returning cached data")
+            # Copy so callers mutating their result can't corrupt the index
+            return dict(cached)
+
+    # Try the cheap static-HTML path first; fall back to Selenium
+    # only when the content genuinely requires a browser
+    fast_result = scrape_icims_job_fast(url, debug,
+                                        collect_full_text=collect_full_text)
+    if fast_result:
+        _remember_job(fast_result)
+        return fast_result
+
+    # Check a pre-warmed browser out of the pool for this job. The fast
+    # path already failed above (that's the only way to get here), so
+    # go straight to the Selenium scrape rather than re-running it
+    if driver is None and pool is not None:
+        with pool.acquire() as pooled_driver:
+            return _scrape_icims_job_selenium(
+                url, debug=debug, driver=pooled_driver,
+                collect_full_text=collect_full_text
+            )
+
+    # Only now is a browser unavoidable - ask the factory for this
+    # caller's reusable driver (it stays alive for the next URL)
+    if driver is None and driver_factory is not None:
+        driver = driver_factory()
+
+    return _scrape_icims_job_selenium(url, debug=debug, driver=driver,
+                                      collect_full_text=collect_full_text)
+
+
+def _scrape_icims_job_selenium(url, debug=True, driver=None,
+                               collect_full_text=False):
+    """
+    Browser-based scrape of a job posting (no cache or fast-path checks).
+
+    Args:
+        url (str): Full URL of the job posting
+        debug (bool): Enable detailed logging
+        driver: Optional existing WebDriver to reuse; one is created
+            (and quit afterwards) when not given
+        collect_full_text (bool): Also store the page's full rendered
+            text as 'full_page_text'
+
+    Returns:
+        dict: Complete job data or None if failed
+
+    Note:
+        Callers normally go through scrape_icims_job, which tries the
+        seen cache and the HTTP fast path before paying for a browser.
+    """
+    owns_driver = driver is None
+
     try:
-        # Step 1: Initialize browser
-        if debug:
-            print("\n" + "="*70)
-            print("STEP 1: Initializing Chrome WebDriver")
-            print("="*70)
-        
-        driver = setup_chrome_driver()
-        
+        # Step 1: Initialize browser (or reuse the caller's session)
+        if owns_driver:
+            if debug:
+                print("\n" + "="*70)
+                print("STEP 1: Initializing Chrome WebDriver")
+                print("="*70)
+
+            driver = setup_chrome_driver()
+        else:
+            if debug:
+                print("\n" + "="*70)
+                print("STEP 1: Reusing existing Chrome WebDriver")
+                print("="*70)
+
+            # Leave any previous page's iframe context behind
+            driver.switch_to.default_content()
+
         # Step 2: Load the page
         if debug:
             print("\n" + "="*70)
@@ -351,9 +1096,14 @@ def scrape_icims_job(url, debug=True):
         
         if debug:
             print("✓ Switched to iframe - now accessing job content")
-        
-        # Wait for content to load
-        time.sleep(3)
+
+        # Wait for the job content itself rather than a fixed 3 seconds -
+        # the <dl> block / info message only appear once the job renders
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "dl, .iCIMS_InfoMsg_Job")
+            )
+        )
         
         # Step 4: Extract job data
         if debug:
@@ -382,48 +1132,84 @@ def scrape_icims_job(url, debug=True):
             if debug:
                 print(f"✓ Job ID: {job_data['job_id']}")
         
-        # Get page source for BeautifulSoup parsing
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # Extract job title
-        job_data['job_title'] = extract_job_title(driver, debug)
-        
-        # Extract location
-        job_data['location'] = extract_location(driver, debug)
-        
-        # Extract additional fields from definition lists
-        job_data['additional_info'] = extract_definition_lists(driver, debug)
-        
-        # Extract job description
-        job_data['description'] = extract_description(driver, debug)
-        
-        # Extract JSON-LD structured data
+        # Serialize the rendered DOM once and parse it in-process -
+        # every extractor then works on the same tree with no further
+        # WebDriver round trips or duplicate parsing. outerHTML via the
+        # JS runtime is consistently faster than driver.page_source,
+        # which rebuilds the source through chromedriver's serializer
+        try:
+            page_source = driver.execute_script(
+                "return document.documentElement.outerHTML;"
+            )
+        except Exception:
+            page_source = driver.page_source
+
+        if FAST_PATH_AVAILABLE:
+            doc = LexborHTMLParser(page_source)
+        else:
+            doc = BeautifulSoup(page_source, 'html.parser')
+
+        # JSON-LD first: it is the cheapest source and usually already
+        # holds title, company, location, description, dates, and salary
         if debug:
             print("\n" + "-"*70)
             print("Extracting JSON-LD Structured Data")
             print("-"*70)
+
+        json_ld_data = extract_json_ld(doc, debug)
+        merge_json_ld(job_data, json_ld_data)
+
+        # DOM extraction only for whatever JSON-LD didn't provide
+        # (additional_info always comes from the definition lists)
+        if FAST_PATH_AVAILABLE:
+            if not job_data['job_title']:
+                job_data['job_title'] = extract_job_title_fast(doc, debug)
+            if not job_data['location']:
+                job_data['location'] = extract_location_fast(doc, debug)
+            if not job_data['description']:
+                job_data['description'] = extract_description_fast(doc, debug)
+            job_data['additional_info'] = extract_definition_lists_fast(doc, debug)
+        else:
+            # No selectolax: batch all selectors into one JS round trip,
+            # with the per-selector extractors as a last resort
+            batched = extract_all_via_js(driver, debug)
+            if batched:
+                job_data['job_title'] = job_data['job_title'] or batched['title']
+                job_data['location'] = job_data['location'] or batched['location']
+                job_data['description'] = job_data['description'] or batched['description']
+                job_data['additional_info'] = batched['additional_info']
+            else:
+                if not job_data['job_title']:
+                    job_data['job_title'] = extract_job_title(driver, debug)
+                if not job_data['location']:
+                    job_data['location'] = extract_location(driver, debug)
+                if not job_data['description']:
+                    job_data['description'] = extract_description(driver, debug)
+                job_data['additional_info'] = extract_definition_lists(driver, debug)
         
-        json_ld_data = extract_json_ld(soup, debug)
-        
-        # Merge JSON-LD data (fill in missing fields)
-        if json_ld_data:
-            for key, value in json_ld_data.items():
-                if value and not job_data.get(key):
-                    job_data[key] = value
-        
-        # Extract full page text as backup
-        try:
-            body = driver.find_element(By.TAG_NAME, "body")
-            job_data['full_page_text'] = body.text
-        except:
-            pass
+        # Full page text is opt-in: it bloats job_data and forcing
+        # Chrome to serialize the rendered text is a slow round trip.
+        # When asked for, pull it from the already-fetched page_source
+        # in-process instead of another WebDriver call
+        if collect_full_text:
+            try:
+                if FAST_PATH_AVAILABLE:
+                    job_data['full_page_text'] = doc.body.text()
+                else:
+                    job_data['full_page_text'] = doc.get_text()
+            except Exception:
+                pass
         
         if debug:
             print("\n" + "="*70)
             print("✓ EXTRACTION COMPLETE")
             print("="*70)
-        
+
+        # Same gate as the fast path: never cache a scrape where every
+        # extractor came up empty, or the bad result would be returned
+        # on all future runs
+        if job_data['job_title'] or job_data['description']:
+            _remember_job(job_data)
         return job_data
         
     except Exception as e:
@@ -433,12 +1219,209 @@ def scrape_icims_job(url, debug=True):
         return None
         
     finally:
-        # Always close the browser
+        if driver:
+            if owns_driver:
+                # Close the browser only if we started it
+                driver.quit()
+                if debug:
+                    print("\n✓ Browser closed")
+            else:
+                # Reset frame context so the next URL starts clean
+                try:
+                    driver.switch_to.default_content()
+                except Exception:
+                    pass
+
+
+def scrape_many(urls, debug=True, ndjson_file=None):
+    """
+    Scrape multiple job postings reusing a single Chrome session.
+
+    Args:
+        urls (list): Job posting URLs to scrape
+        debug (bool): Enable detailed logging
+        ndjson_file (str): Optional NDJSON path; each job is appended
+            (and flushed) as soon as its scrape completes, so a crash
+            mid-batch loses nothing already scraped
+
+    Returns:
+        list: Job data dicts (failed URLs are skipped)
+
+    Why:
+        Chrome cold-start costs hundreds of ms to seconds per launch.
+        Creating the driver once and reusing it for every URL amortizes
+        that cost across the whole batch.
+    """
+    results = []
+    driver = None
+
+    try:
+        driver = setup_chrome_driver()
+
+        for url in urls:
+            job_data = scrape_icims_job(url, debug=debug, driver=driver)
+            if job_data:
+                results.append(job_data)
+                if ndjson_file:
+                    append_ndjson(job_data, ndjson_file)
+
+    finally:
         if driver:
             driver.quit()
             if debug:
                 print("\n✓ Browser closed")
 
+    return results
+
+
+class BrowserPool:
+    """
+    Pool of pre-warmed Chrome instances with acquire/release semantics.
+
+    Usage:
+        pool = BrowserPool(size=4)
+        with pool.acquire() as driver:
+            job_data = scrape_icims_job(url, driver=driver)
+        pool.close()
+
+    Why:
+        For high-throughput scraping, launching Chrome per job wastes
+        hundreds of ms to seconds each time. The pool pays browser
+        startup once at init; jobs just check a warm instance out of a
+        queue and return it when done.
+    """
+
+    def __init__(self, size=4):
+        """
+        Launch `size` Chrome instances up front and queue them as idle.
+
+        Args:
+            size (int): Number of browsers to keep warm
+        """
+        self.size = size
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(setup_chrome_driver())
+
+    @contextmanager
+    def acquire(self):
+        """
+        Check a warm driver out of the pool (blocking if all are busy).
+
+        Yields:
+            webdriver.Chrome: A driver reserved for this caller; it is
+            released back to the pool automatically on exit
+        """
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def release(self, driver):
+        """
+        Return a driver to the pool, resetting its state first.
+
+        Args:
+            driver: The driver obtained from acquire()
+
+        Note:
+            If the browser died mid-job, it is replaced with a fresh
+            instance so the pool never shrinks.
+        """
+        try:
+            driver.delete_all_cookies()
+            driver.switch_to.default_content()
+        except Exception:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            driver = setup_chrome_driver()
+        self._idle.put(driver)
+
+    def close(self):
+        """
+        Quit every idle browser. Call once, after all jobs are done.
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+# One WebDriver per worker thread. Selenium releases the GIL during its
+# HTTP round trips to chromedriver, so threads overlap network/browser
+# wait time almost linearly.
+threadLocal = threading.local()
+_thread_drivers = []
+_thread_drivers_lock = threading.Lock()
+
+
+def get_driver():
+    """
+    Return this thread's WebDriver, creating it on first use.
+
+    Returns:
+        webdriver.Chrome: The calling thread's dedicated driver
+
+    Note:
+        Drivers are tracked in a module-level list so
+        scrape_many_parallel can quit all of them at shutdown.
+    """
+    driver = getattr(threadLocal, 'driver', None)
+    if driver is None:
+        driver = setup_chrome_driver()
+        threadLocal.driver = driver
+        with _thread_drivers_lock:
+            _thread_drivers.append(driver)
+    return driver
+
+
+def scrape_many_parallel(urls, max_workers=4, debug=False):
+    """
+    Scrape multiple job postings concurrently with a thread pool.
+
+    Args:
+        urls (list): Job posting URLs to scrape
+        max_workers (int): Worker thread count; tune toward CPU count
+            or the target site's tolerated concurrency
+        debug (bool): Enable detailed logging (noisy when interleaved
+            across threads, so off by default)
+
+    Returns:
+        list: Job data dicts (failed URLs are skipped)
+
+    Why:
+        Each thread keeps its own Chrome instance (threading.local), so
+        browser startup is paid once per worker while page loads across
+        the batch overlap.
+    """
+    def scrape_one(url):
+        # Pass get_driver as a factory so this thread's Chrome only
+        # launches if a URL actually misses the cache and the fast path
+        return scrape_icims_job(url, debug=debug, driver_factory=get_driver)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(scrape_one, urls))
+    finally:
+        # Quit every thread's browser once the pool is done
+        with _thread_drivers_lock:
+            for driver in _thread_drivers:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+            _thread_drivers.clear()
+
+    return [job_data for job_data in results if job_data]
+
 
 def save_to_json(data, filename='job_posting.json'):
     """
@@ -453,7 +1436,13 @@ def save_to_json(data, filename='job_posting.json'):
     """
     try:
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                f.write(orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode())
+            else:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"\n✓ Data saved to '{filename}'")
         return True
     except Exception as e:
@@ -461,6 +1450,65 @@ def save_to_json(data, filename='job_posting.json'):
         return False
 
 
+def append_ndjson(data, filename='job_postings.ndjson'):
+    """
+    Append one job record to an NDJSON file (one JSON object per line).
+
+    Args:
+        data (dict): Job data to append
+        filename (str): Output filename
+
+    Returns:
+        bool: True if successful, False otherwise
+
+    Why:
+        Batch scrapes that build one giant JSON array hold every record
+        in memory and lose everything on a crash. Appending a line per
+        job keeps memory flat and preserves partial results, and skips
+        the pretty-printer entirely.
+    """
+    try:
+        with open(filename, 'ab') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(data) + b"\n")
+            else:
+                f.write(json.dumps(data, ensure_ascii=False).encode('utf-8') + b"\n")
+        return True
+    except Exception as e:
+        print(f"\n✗ Failed to append to '{filename}': {str(e)}")
+        return False
+
+
+def ndjson_to_json_array(path, skip_invalid=False):
+    """
+    Load an NDJSON file back into a list of job dicts.
+
+    Args:
+        path (str): Path to the NDJSON file
+        skip_invalid (bool): Silently drop lines that fail to parse
+            instead of raising - e.g. a line truncated by a crash
+            mid-append
+
+    Returns:
+        list: All records, for callers that want a single array
+    """
+    records = []
+    with open(path, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                if orjson is not None:
+                    records.append(orjson.loads(line))
+                else:
+                    records.append(json.loads(line))
+            except ValueError:
+                if not skip_invalid:
+                    raise
+    return records
+
+
 def display_results(job_data):
     """
     Display scraped results in a formatted manner.
@@ -0,0 +1,37 @@
+"""
+Optional Cython build for the scraper.
+
+Selenium dominates wall time on single pages, but when scraping
+thousands of postings the Python-side work (definition-list iteration,
+JSON-LD handling, per-selector loops) adds up. Compiling scrape_job.py
+with Cython in pure-Python mode turns that interpreter dispatch into
+native code with no source changes.
+
+This step is entirely optional - `python scrape_job.py` works the same
+either way, and the script also runs unmodified under PyPy, whose JIT
+gives a similar speedup for free.
+
+Usage:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+if cythonize is not None:
+    setup(
+        name='web_scrap',
+        ext_modules=cythonize(
+            ['scrape_job.py'],
+            compiler_directives={'language_level': 3},
+        ),
+    )
+else:
+    print("Cython not installed - skipping compilation "
+          "(run 'pip install cython' to enable it)")
+    setup(name='web_scrap')